@@ -1,25 +1,37 @@
 import os
+import re
+import gzip
 import sys
+import time
+import asyncio
+import functools
 import logging
-import traceback
+import secrets
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
-from typing import Dict, Any
-from datetime import datetime
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+from datetime import datetime, timezone
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.openapi.docs import get_redoc_html, get_swagger_ui_html
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field, field_validator
+import orjson
 import uvicorn
+from diskcache import Cache
 
-# Import the crew after setting up the path
-try:
-    from src.open_source.crew import OpenSourceCrew
-except ImportError as e:
-    print(f"Import error: {e}")
-    # Add current directory to path for imports
-    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-    from src.open_source.crew import OpenSourceCrew
+# Disable CrewAI telemetry to avoid connection issues; this must happen
+# before crewai is imported, which is when its telemetry client starts
+os.environ["OTEL_SDK_DISABLED"] = "true"
+os.environ["CREWAI_DISABLE_TELEMETRY"] = "true"
+os.environ["CREWAI_TELEMETRY_OPT_OUT"] = "true"
+
+from src.open_source.crew import OpenSourceCrew, close_pools
 
 # Configure logging
 logging.basicConfig(
@@ -30,6 +42,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Pydantic Models
+# Response models below only document the OpenAPI schema; handlers return
+# plain payloads so responses skip Pydantic validation and re-encoding.
 class BusinessRequirementRequest(BaseModel):
     """Request model for business requirement analysis"""
     business_requirement: str = Field(
@@ -62,42 +76,247 @@ class ErrorResponse(BaseModel):
     timestamp: datetime = Field(description="Error timestamp")
     detail: str = Field(default="", description="Detailed error information")
 
+class AsyncAnalysisResponse(BaseModel):
+    """Response model for a submitted background analysis"""
+    status: str = "accepted"
+    task_id: str = Field(description="Identifier to poll for the result")
+    status_url: str = Field(description="Endpoint returning the task status and result")
+    timestamp: datetime = Field(description="Submission timestamp")
+
+class AnalysisTaskResponse(BaseModel):
+    """Response model for a background analysis task"""
+    task_id: str = Field(description="Task identifier")
+    status: str = Field(description="One of pending, running, completed or failed")
+    submitted_at: datetime = Field(description="Submission timestamp")
+    completed_at: Optional[datetime] = Field(default=None, description="Completion timestamp")
+    result: Optional[str] = Field(default=None, description="Analysis result once completed")
+    error: Optional[str] = Field(default=None, description="Error message if the task failed")
+    execution_time_seconds: Optional[float] = Field(default=None, description="Execution time in seconds")
+
 class HealthResponse(BaseModel):
     """Health check response model"""
     status: str = "healthy"
     timestamp: datetime = Field(description="Health check timestamp")
     version: str = "1.0.0"
     environment: str = Field(description="Current environment")
+    environment_check: str = Field(description="Environment validation message")
 
 # Global variables for environment validation
 REQUIRED_ENV_VARS = ["GEMINI_API_KEY", "SERPER_API_KEY"]
 
+# Classifiers for upstream AI service errors, compiled once at import
+_RETRYABLE_RE = re.compile(r"rate ?limit|quota|overloaded|unavailable|503", re.IGNORECASE)
+_AUTH_RE = re.compile(r"api key|authentication|permission|forbidden", re.IGNORECASE)
+
+# Dedicated pool for blocking CrewAI runs so they never stall the event loop
+CREW_WORKERS = int(os.getenv("CREW_WORKERS", "8"))
+EXECUTOR = ThreadPoolExecutor(max_workers=CREW_WORKERS, thread_name_prefix="crew")
+
+# Crew runs allowed at once per worker process; extra requests wait their turn
+# instead of firing simultaneous Gemini/Serper calls into rate limits
+MAX_INFLIGHT = int(os.getenv("MAX_INFLIGHT", "3"))
+
+# Number of reusable OpenSourceCrew instances kept warm per worker process
+CREW_POOL_SIZE = int(os.getenv("CREW_POOL_SIZE", str(MAX_INFLIGHT)))
+
+# Finished /analyze-async results are kept for this many seconds
+ASYNC_RESULT_TTL = float(os.getenv("ASYNC_RESULT_TTL", "3600"))
+
+# /analyze-async job state lives in an on-disk store shared by every worker
+# process on the host, so a poll may land on any worker. Separate hosts or
+# instances (e.g. Cloud Run replicas) each have their own store.
+JOB_STORE = Cache(os.getenv("JOB_STORE_DIR", os.path.join(tempfile.gettempdir(), "open_source_jobs")))
+
+# Near-static endpoints are served from a short-lived in-memory cache
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "2"))
+_response_cache: Dict[str, Tuple[float, bytes]] = {}
+
+@dataclass(frozen=True, slots=True)
+class EnvConfig:
+    """Immutable snapshot of the environment, taken once at startup"""
+    gemini_api_key: Optional[str]
+    serper_api_key: Optional[str]
+    environment: str
+    missing_vars: Tuple[str, ...]
+    is_valid: bool
+    message: str
+
+    @classmethod
+    def from_environ(cls) -> "EnvConfig":
+        missing_vars = tuple(var for var in REQUIRED_ENV_VARS if not os.getenv(var))
+        if missing_vars:
+            message = f"Missing required environment variables: {', '.join(missing_vars)}"
+        else:
+            message = "Environment OK"
+        return cls(
+            gemini_api_key=os.getenv("GEMINI_API_KEY"),
+            serper_api_key=os.getenv("SERPER_API_KEY"),
+            environment=os.getenv("ENVIRONMENT", "production"),
+            missing_vars=missing_vars,
+            is_valid=not missing_vars,
+            message=message
+        )
+
+def get_env_config() -> EnvConfig:
+    """Return the startup snapshot, building it if lifespan has not run yet.
+
+    Tests can override the snapshot by assigning ``app.state.env_cfg``.
+    """
+    env_cfg = getattr(app.state, "env_cfg", None)
+    if env_cfg is None:
+        env_cfg = app.state.env_cfg = EnvConfig.from_environ()
+    return env_cfg
+
+class CrewPool:
+    """Fixed-size pool of reusable OpenSourceCrew instances.
+
+    Each instance is checked out by one request at a time, so the LLM client
+    and parsed configs are built once instead of on every /analyze call.
+    Missing instances are created on demand up to ``size``.
+    """
+
+    def __init__(self, size: int, gemini_api_key: Optional[str]):
+        self.size = size
+        self.gemini_api_key = gemini_api_key
+        self._created = 0
+        self._idle: asyncio.Queue = asyncio.Queue()
+
+    def _new_crew(self) -> OpenSourceCrew:
+        crew = OpenSourceCrew(gemini_api_key=self.gemini_api_key)
+        self._created += 1
+        return crew
+
+    def fill(self):
+        """Pre-build every instance so the first requests skip construction"""
+        while self._created < self.size:
+            self._idle.put_nowait(self._new_crew())
+
+    async def acquire(self) -> OpenSourceCrew:
+        if self._idle.empty() and self._created < self.size:
+            # Claim the slot before awaiting so concurrent callers cannot overshoot size
+            self._created += 1
+            try:
+                # Construction builds the LLM client and reads configs; keep it off the event loop
+                return await asyncio.to_thread(OpenSourceCrew, gemini_api_key=self.gemini_api_key)
+            except BaseException:
+                self._created -= 1
+                raise
+        return await self._idle.get()
+
+    def release(self, crew: OpenSourceCrew):
+        self._idle.put_nowait(crew)
+
+@dataclass(slots=True)
+class AnalysisJob:
+    """State of a background /analyze-async run"""
+    task_id: str
+    submitted_at: datetime
+    status: str = "pending"
+    completed_at: Optional[datetime] = None
+    result: Optional[str] = None
+    error: Optional[str] = None
+    execution_time_seconds: Optional[float] = None
+
+    def to_payload(self) -> Dict[str, Any]:
+        return {
+            "task_id": self.task_id,
+            "status": self.status,
+            "submitted_at": self.submitted_at,
+            "completed_at": self.completed_at,
+            "result": self.result,
+            "error": self.error,
+            "execution_time_seconds": self.execution_time_seconds
+        }
+
+# Background analyses running in this worker, keyed by task ID; holding the
+# references keeps the tasks from being garbage-collected mid-run
+_job_tasks: Dict[str, asyncio.Task] = {}
+
+# Crew runs currently in progress, keyed by normalized requirement
+_inflight_analyses: Dict[str, asyncio.Future] = {}
+
+async def save_job(job: AnalysisJob):
+    """Publish a job's state to the shared store; entries expire ASYNC_RESULT_TTL after the last update"""
+    await asyncio.to_thread(JOB_STORE.set, job.task_id, job.to_payload(), expire=ASYNC_RESULT_TTL)
+
+def get_crew_semaphore() -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent crew runs, creating it if lifespan has not run yet"""
+    crew_sem = getattr(app.state, "crew_sem", None)
+    if crew_sem is None:
+        crew_sem = app.state.crew_sem = asyncio.Semaphore(MAX_INFLIGHT)
+    return crew_sem
+
+def get_crew_pool() -> CrewPool:
+    """Return the process-wide crew pool, creating it if lifespan has not run yet"""
+    crew_pool = getattr(app.state, "crew_pool", None)
+    if crew_pool is None:
+        crew_pool = app.state.crew_pool = CrewPool(CREW_POOL_SIZE, get_env_config().gemini_api_key)
+    return crew_pool
+
+def ttl_cached(endpoint):
+    """Serve an argument-less endpoint's payload from cache for RESPONSE_CACHE_TTL seconds.
+
+    The payload is serialized once per TTL window and each hit returns the
+    cached bytes directly, bypassing FastAPI's response encoding.
+    """
+    key = endpoint.__name__
+
+    @functools.wraps(endpoint)
+    async def wrapper():
+        now = time.monotonic()
+        cached = _response_cache.get(key)
+        if cached is None or cached[0] <= now:
+            cached = _response_cache[key] = (now + RESPONSE_CACHE_TTL, orjson.dumps(await endpoint()))
+        return Response(content=cached[1], media_type="application/json")
+
+    return wrapper
+
+def get_openapi_payload() -> Tuple[bytes, bytes]:
+    """Return the OpenAPI schema as (json, gzipped json), building it once per process"""
+    payload = getattr(app.state, "openapi_payload", None)
+    if payload is None:
+        body = orjson.dumps(app.openapi())
+        payload = app.state.openapi_payload = (body, gzip.compress(body))
+    return payload
+
+def utc_now() -> datetime:
+    """Current UTC time, taken once per response; orjson serializes it natively"""
+    return datetime.now(timezone.utc)
+
 def validate_environment():
-    """Validate required environment variables"""
-    missing_vars = []
-    for var in REQUIRED_ENV_VARS:
-        if not os.getenv(var):
-            missing_vars.append(var)
-    
-    if missing_vars:
-        error_msg = f"Missing required environment variables: {', '.join(missing_vars)}"
-        logger.error(error_msg)
-        return False, error_msg
-    
-    logger.info("Environment validation successful")
-    return True, "Environment OK"
+    """Validate required environment variables.
+
+    Kept free of I/O (including logging) because the async handlers call it
+    directly on the event loop; callers log the outcome where it matters.
+    """
+    env_cfg = get_env_config()
+    return env_cfg.is_valid, env_cfg.message
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     # Startup
     logger.info("Starting Open Source Research API...")
+    _response_cache.clear()
     
-    # Validate required environment variables
+    # Snapshot and validate required environment variables
+    app.state.env_cfg = EnvConfig.from_environ()
+    app.state.crew_sem = asyncio.Semaphore(MAX_INFLIGHT)
     is_valid, message = validate_environment()
     if not is_valid:
         logger.warning(f"Environment validation failed: {message}")
         # Don't fail startup, but log the warning
+    else:
+        logger.info("Environment validation successful")
+        try:
+            get_crew_pool().fill()
+            logger.info(f"Crew pool ready with {CREW_POOL_SIZE} instances")
+        except Exception as e:
+            # Instances are created on demand if pre-filling fails
+            logger.warning(f"Could not pre-fill crew pool: {e}")
+    
+    # Build the OpenAPI schema now rather than on the first /docs visit
+    get_openapi_payload()
     
     logger.info("Application startup complete")
     
@@ -105,42 +324,180 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down Open Source Research API...")
+    # Cancel unfinished background jobs so they are stored as failed before the store closes
+    pending_jobs = list(_job_tasks.values())
+    for task in pending_jobs:
+        task.cancel()
+    await asyncio.gather(*pending_jobs, return_exceptions=True)
+    EXECUTOR.shutdown(wait=False, cancel_futures=True)
+    close_pools()
+    JOB_STORE.close()
 
 # FastAPI application setup
 app = FastAPI(
     title="Open Source Project Research API",
     description="AI-powered API for discovering and analyzing open-source projects based on business requirements",
     version="1.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
+    # Docs and schema routes are registered below to serve the prebuilt schema
+    docs_url=None,
+    redoc_url=None,
+    openapi_url=None,
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
 # Middleware setup
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Compress large payloads such as /analyze results; responses that already
+# carry a Content-Encoding (the prebuilt OpenAPI schema) pass through untouched
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Both are opt-in so backend-to-backend deployments keep them off the ASGI stack
+if os.getenv("ENABLE_CORS") == "1":
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=os.getenv("CORS_ORIGINS", "*").split(","),
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+if os.getenv("TRUSTED_HOSTS"):
+    app.add_middleware(
+        TrustedHostMiddleware,
+        allowed_hosts=os.getenv("TRUSTED_HOSTS").split(",")
+    )
+
+async def run_analysis(business_requirement: str) -> str:
+    """Run the crew for a requirement, sharing the run with identical in-flight requests.
+
+    Concurrent callers whose requirements only differ in case or whitespace
+    await the same crew run instead of each spending LLM and Serper quota.
+    """
+    key = " ".join(business_requirement.split()).casefold()
+    analysis = _inflight_analyses.get(key)
+    if analysis is None:
+        analysis = asyncio.ensure_future(execute_analysis(business_requirement))
+        _inflight_analyses[key] = analysis
+        analysis.add_done_callback(lambda _: _inflight_analyses.pop(key, None))
+    else:
+        logger.info("Joining in-flight analysis for an identical requirement")
+    # Shield so one disconnecting client does not cancel the run for the others
+    return await asyncio.shield(analysis)
+
+async def execute_analysis(business_requirement: str) -> str:
+    """Run the crew for one requirement on a pooled instance and return its result"""
+    logger.info(f"Starting analysis for requirement: {business_requirement[:100]}...")
+    
+    # Validate environment variables
+    is_valid, env_message = validate_environment()
+    if not is_valid:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Server configuration error: {env_message}"
+        )
+    
+    # Get API keys from the startup snapshot
+    gemini_api_key = get_env_config().gemini_api_key
+    if not gemini_api_key:
+        raise HTTPException(
+            status_code=500,
+            detail="GEMINI_API_KEY not configured"
+        )
+    
+    # Check out a pooled CrewAI instance and run the analysis
+    logger.info("Checking out CrewAI instance...")
+    
+    # Queue on the semaphore before touching the pool or an executor thread
+    async with get_crew_semaphore():
+        crew_pool = get_crew_pool()
+        crew = await crew_pool.acquire()
+        try:
+            logger.info("Executing CrewAI analysis...")
+            # crew.run() is synchronous and long-running; run it on the crew executor
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(EXECUTOR, crew.run, business_requirement)
+        finally:
+            crew_pool.release(crew)
+    
+    # Check if result is None or empty
+    if not result or str(result).strip() == "":
+        raise HTTPException(
+            status_code=500,
+            detail="AI analysis returned empty result. This might be due to API rate limits or connectivity issues."
+        )
+    
+    return result
+
+def analysis_error(e: Exception) -> HTTPException:
+    """Log a failed analysis and map it to the HTTP error returned to clients"""
+    if isinstance(e, ValueError):
+        # Handle known validation errors
+        logger.error(f"Validation error: {str(e)}")
+        return HTTPException(status_code=400, detail=str(e))
+    
+    # Handle unexpected errors
+    error_msg = str(e)
+    # exc_info defers traceback formatting to the handler, only if the record is emitted
+    logger.error("Analysis failed: %s", error_msg, exc_info=e)
+    
+    # Check for specific API-related errors
+    if _RETRYABLE_RE.search(error_msg):
+        return HTTPException(
+            status_code=503,
+            detail="AI service is temporarily unavailable. Please try again in a few minutes."
+        )
+    elif _AUTH_RE.search(error_msg):
+        return HTTPException(
+            status_code=500,
+            detail="Server configuration error: Invalid API key configuration"
+        )
+    else:
+        return HTTPException(
+            status_code=500,
+            detail=f"An unexpected error occurred during analysis: {error_msg}"
+        )
+
+async def run_analysis_job(job: AnalysisJob, business_requirement: str):
+    """Drive a background analysis and record its outcome in the job store"""
+    job.status = "running"
+    await save_job(job)
+    start_time = time.perf_counter()
+    try:
+        job.result = await run_analysis(business_requirement)
+        job.status = "completed"
+    except asyncio.CancelledError:
+        job.error = "Analysis cancelled: server shutting down"
+        job.status = "failed"
+        raise
+    except Exception as e:
+        error = e if isinstance(e, HTTPException) else analysis_error(e)
+        job.error = error.detail
+        job.status = "failed"
+    finally:
+        job.execution_time_seconds = time.perf_counter() - start_time
+        job.completed_at = utc_now()
+        await save_job(job)
+        _job_tasks.pop(job.task_id, None)
+        logger.info(f"Background analysis {job.task_id} {job.status} in {job.execution_time_seconds:.2f} seconds")
 
 # Custom middleware for request logging
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all incoming requests"""
-    start_time = datetime.now()
+    # Skip all per-request formatting when INFO records would be dropped anyway
+    if not logger.isEnabledFor(logging.INFO):
+        return await call_next(request)
+    
+    start_time = time.perf_counter()
     
     # Log request details
     client_host = request.client.host if request.client else 'unknown'
-    logger.info(f"Request: {request.method} {request.url.path} from {client_host}")
+    logger.info("Request: %s %s from %s", request.method, request.url.path, client_host)
     
     response = await call_next(request)
     
     # Log response details
-    process_time = (datetime.now() - start_time).total_seconds()
-    logger.info(f"Response: {response.status_code} - {process_time:.3f}s")
+    logger.info("Response: %s - %.3fs", response.status_code, time.perf_counter() - start_time)
     
     return response
 
@@ -149,12 +506,12 @@ async def log_requests(request: Request, call_next):
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions"""
     logger.warning(f"HTTP {exc.status_code}: {exc.detail}")
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "status": "error",
             "message": exc.detail,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": utc_now(),
             "detail": f"HTTP {exc.status_code} error"
         }
     )
@@ -162,53 +519,84 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
-    error_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-    logger.error(f"Unhandled exception [{error_id}]: {str(exc)}")
-    logger.error(f"Traceback [{error_id}]: {traceback.format_exc()}")
+    error_id = secrets.token_hex(8)
+    logger.error("Unhandled exception [%s]: %s", error_id, exc, exc_info=exc)
     
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "status": "error",
             "message": "An internal server error occurred",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": utc_now(),
             "detail": f"Error ID: {error_id}"
         }
     )
 
+# Documentation routes
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_json(request: Request):
+    """Serve the prebuilt OpenAPI schema, gzipped when the client accepts it"""
+    body, gzipped = get_openapi_payload()
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        return Response(
+            content=gzipped,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        )
+    return Response(content=body, media_type="application/json", headers={"Vary": "Accept-Encoding"})
+
+@app.get("/docs", include_in_schema=False)
+async def swagger_ui():
+    return get_swagger_ui_html(openapi_url="/openapi.json", title=f"{app.title} - Swagger UI")
+
+@app.get("/redoc", include_in_schema=False)
+async def redoc():
+    return get_redoc_html(openapi_url="/openapi.json", title=f"{app.title} - ReDoc")
+
 # API Routes
 @app.get("/")
+@ttl_cached
 async def root():
     """Root endpoint with API information"""
     return {
         "service": "Open Source Project Research API",
         "version": "1.0.0",
         "status": "running",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": utc_now(),
         "documentation": "/docs",
         "health_check": "/health",
         "endpoints": {
             "analyze": "/analyze",
+            "analyze_async": "/analyze-async",
             "health": "/health",
             "version": "/version",
             "status": "/status"
         }
     }
 
-@app.get("/health")
+@app.get("/health", responses={200: {"model": HealthResponse}})
+@ttl_cached
 async def health_check():
     """Health check endpoint for Cloud Run"""
     is_valid, env_message = validate_environment()
     
     return {
         "status": "healthy" if is_valid else "degraded",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": utc_now(),
         "version": "1.0.0",
-        "environment": os.getenv("ENVIRONMENT", "production"),
+        "environment": get_env_config().environment,
         "environment_check": env_message
     }
 
-@app.post("/analyze")
+@app.post(
+    "/analyze",
+    responses={
+        200: {"model": AnalysisResponse},
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
+    }
+)
 async def analyze_requirement(request: BusinessRequirementRequest):
     """
     Analyze business requirements and find suitable open-source projects
@@ -220,100 +608,93 @@ async def analyze_requirement(request: BusinessRequirementRequest):
     
     Returns detailed analysis with project recommendations.
     """
-    start_time = datetime.now()
+    start_time = time.perf_counter()
     
     try:
-        logger.info(f"Starting analysis for requirement: {request.business_requirement[:100]}...")
-        
-        # Validate environment variables
-        is_valid, env_message = validate_environment()
-        if not is_valid:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Server configuration error: {env_message}"
-            )
-        
-        # Get API keys from environment
-        gemini_api_key = os.getenv("GEMINI_API_KEY")
-        if not gemini_api_key:
-            raise HTTPException(
-                status_code=500,
-                detail="GEMINI_API_KEY not configured"
-            )
-        
-        # Create and run the CrewAI analysis
-        logger.info("Creating CrewAI instance...")
-        
-        # Disable CrewAI telemetry to avoid connection issues
-        os.environ["OTEL_SDK_DISABLED"] = "true"
-        os.environ["CREWAI_TELEMETRY_OPT_OUT"] = "true"
-        
-        crew = OpenSourceCrew(
-            business_requirement=request.business_requirement,
-            gemini_api_key=gemini_api_key
-        )
-        
-        logger.info("Executing CrewAI analysis...")
-        result = crew.run()
-        
-        # Check if result is None or empty
-        if not result or str(result).strip() == "":
-            raise HTTPException(
-                status_code=500,
-                detail="AI analysis returned empty result. This might be due to API rate limits or connectivity issues."
-            )
-        
-        execution_time = (datetime.now() - start_time).total_seconds()
+        result = await run_analysis(request.business_requirement)
+        execution_time = time.perf_counter() - start_time
         
         logger.info(f"Analysis completed successfully in {execution_time:.2f} seconds")
         
-        return {
+        return ORJSONResponse({
             "status": "success",
             "message": "Analysis completed successfully",
             "result": result,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": utc_now(),
             "execution_time_seconds": execution_time
-        }
-        
-    except ValueError as e:
-        # Handle known validation errors
-        logger.error(f"Validation error: {str(e)}")
-        raise HTTPException(status_code=400, detail=str(e))
+        })
         
+    except HTTPException:
+        raise
     except Exception as e:
-        # Handle unexpected errors
-        error_msg = str(e)
-        logger.error(f"Analysis failed: {error_msg}")
-        logger.error(f"Full traceback: {traceback.format_exc()}")
-        
-        # Check for specific API-related errors
-        if any(keyword in error_msg.lower() for keyword in ['overloaded', 'unavailable', '503', 'rate limit', 'quota']):
-            raise HTTPException(
-                status_code=503,
-                detail="AI service is temporarily unavailable. Please try again in a few minutes."
-            )
-        elif any(keyword in error_msg.lower() for keyword in ['api key', 'authentication', 'permission', 'forbidden']):
-            raise HTTPException(
-                status_code=500,
-                detail="Server configuration error: Invalid API key configuration"
-            )
-        else:
-            raise HTTPException(
-                status_code=500,
-                detail=f"An unexpected error occurred during analysis: {error_msg}"
-            )
+        raise analysis_error(e)
+
+@app.post(
+    "/analyze-async",
+    status_code=202,
+    responses={
+        202: {"model": AsyncAnalysisResponse},
+        500: {"model": ErrorResponse}
+    }
+)
+async def analyze_requirement_async(request: BusinessRequirementRequest):
+    """
+    Submit a business requirement for background analysis
+    
+    The analysis runs on the crew executor without holding the request open.
+    Poll the returned status URL for the result, which is kept for
+    ASYNC_RESULT_TTL seconds after the task finishes.
+    """
+    is_valid, env_message = validate_environment()
+    if not is_valid:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Server configuration error: {env_message}"
+        )
+    
+    task_id = secrets.token_hex(8)
+    job = AnalysisJob(task_id=task_id, submitted_at=utc_now())
+    await save_job(job)
+    _job_tasks[task_id] = asyncio.create_task(run_analysis_job(job, request.business_requirement))
+    logger.info(f"Queued background analysis {task_id}")
+    
+    return ORJSONResponse(
+        status_code=202,
+        content={
+            "status": "accepted",
+            "task_id": task_id,
+            "status_url": f"/analyze-async/{task_id}",
+            "timestamp": job.submitted_at
+        }
+    )
+
+@app.get(
+    "/analyze-async/{task_id}",
+    responses={
+        200: {"model": AnalysisTaskResponse},
+        404: {"model": ErrorResponse}
+    }
+)
+async def get_analysis_task(task_id: str):
+    """Get the status, and once finished the result, of a background analysis"""
+    payload = await asyncio.to_thread(JOB_STORE.get, task_id)
+    if payload is None:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired task: {task_id}")
+    return ORJSONResponse(payload)
 
 @app.get("/version")
+@ttl_cached
 async def get_version():
     """Get API version information"""
     return {
         "version": "1.0.0",
         "build_date": "2025-01-13",
         "python_version": sys.version,
-        "environment": os.getenv("ENVIRONMENT", "production")
+        "environment": get_env_config().environment
     }
 
 @app.get("/status")
+@ttl_cached
 async def get_status():
     """Get detailed service status"""
     is_valid, env_message = validate_environment()
@@ -321,7 +702,7 @@ async def get_status():
     return {
         "service": "Open Source Project Research API",
         "status": "operational" if is_valid else "degraded",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": utc_now(),
         "environment_variables_configured": is_valid,
         "environment_check": env_message,
         "required_env_vars": REQUIRED_ENV_VARS,
@@ -332,12 +713,18 @@ async def get_status():
 # For local development
 if __name__ == "__main__":
     port = int(os.getenv("PORT", 8080))
-    logger.info(f"Starting server on port {port}")
+    # Cloud Run scales by instance, so keep a single worker there
+    default_workers = "1" if os.getenv("K_SERVICE") else "4"
+    workers = int(os.getenv("WEB_CONCURRENCY", default_workers))
+    logger.info(f"Starting server on port {port} with {workers} worker(s)")
     uvicorn.run(
         "api:app",
         host="0.0.0.0",
         port=port,
+        workers=workers,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",  # uvloop has no Windows build
+        http="httptools",
         log_level="info",
-        access_log=True,
+        access_log=os.getenv("ENVIRONMENT", "production") != "production",
         reload=False
     )
\ No newline at end of file
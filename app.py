@@ -1,6 +1,14 @@
+import time
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
 import streamlit as st
 from src.open_source.crew import OpenSourceCrew
 
+THEME_CSS_PATH = Path(__file__).parent / "static" / "theme.css"
+CREW_WORKERS = 4
+
 st.set_page_config(
     page_title="AI Open Source Researcher",
     page_icon="🌌",
@@ -8,126 +16,39 @@ st.set_page_config(
     initial_sidebar_state="auto"
 )
 
-st.markdown("""
-<style>
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap');
-
-    /* --- Base Styles --- */
-    body {
-        font-family: 'Inter', sans-serif;
-    }
-    .stApp {
-        background-color: #0d1117;
-        color: #e6edf3;
-    }
-
-    /* --- Main Content Area --- */
-    .block-container {
-        padding-top: 3rem;
-        padding-bottom: 3rem;
-    }
-
-    /* --- Header --- */
-    .header {
-        font-size: 52px;
-        font-weight: 700;
-        text-align: center;
-        margin-bottom: 1rem;
-        background: -webkit-linear-gradient(45deg, #58a6ff, #a371f7);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-    }
-    .subheader {
-        text-align: center;
-        color: #8b949e;
-        font-size: 1.2rem;
-        margin-bottom: 4rem;
-        font-weight: 400;
-    }
-
-    /* --- Input Text Area --- */
-    .stTextArea textarea {
-        background-color: #161b22;
-        color: #e6edf3;
-        border: 1px solid #30363d;
-        border-radius: 12px;
-        min-height: 200px;
-        font-size: 16px;
-        box-shadow: 0 4px 12px rgba(0,0,0,0.2);
-        transition: all 0.3s ease;
-        font-family: 'Inter', sans-serif;
-    }
-    .stTextArea textarea:focus {
-        border-color: #58a6ff;
-        box-shadow: 0 0 0 3px rgba(88, 166, 255, 0.3);
-    }
-
-    /* --- Button --- */
-    .stButton>button {
-        width: 100%;
-        background-image: linear-gradient(45deg, #58a6ff 0%, #a371f7 100%);
-        color: white;
-        border: none;
-        padding: 1rem 1.5rem;
-        border-radius: 12px;
-        font-weight: 600;
-        font-size: 18px;
-        transition: all 0.3s ease;
-        box-shadow: 0 4px 14px rgba(88, 166, 255, 0.25);
-        cursor: pointer;
-    }
-    .stButton>button:hover {
-        transform: translateY(-3px);
-        box-shadow: 0 6px 20px rgba(88, 166, 255, 0.35);
-    }
-
-    /* --- Glassmorphism Cards --- */
-    .card {
-        background: rgba(22, 27, 34, 0.6);
-        backdrop-filter: blur(10px);
-        -webkit-backdrop-filter: blur(10px);
-        border: 1px solid rgba(48, 54, 61, 0.5);
-        padding: 25px;
-        border-radius: 15px;
-        margin-bottom: 20px;
-        box-shadow: 0 8px 32px 0 rgba(0, 0, 0, 0.37);
-    }
-    .card h4 {
-        color: #58a6ff;
-        margin-bottom: 1rem;
-        font-weight: 600;
-    }
-    .card li {
-        color: #c9d1d9;
-    }
-    
-    /* --- Results Box --- */
-    .results-box {
-        white-space: pre-wrap;
-        font-family: 'SF Mono', 'Consolas', 'Liberation Mono', Menlo, Courier, monospace;
-        background-color: #010409;
-        color: #c9d1d9;
-        border: 1px solid #30363d;
-        padding: 25px;
-        border-radius: 10px;
-        margin-top: 20px;
-        font-size: 14px;
-        line-height: 1.6;
-    }
-
-    /* --- Warning Box --- */
-    .warning-box {
-        background-color: #1f2937;
-        border: 1px solid #f59e0b;
-        border-radius: 8px;
-        padding: 12px;
-        margin-bottom: 20px;
-        color: #f59e0b;
-        font-size: 14px;
-    }
-
-</style>
-""", unsafe_allow_html=True)
+@st.cache_data
+def load_theme_css() -> str:
+    return THEME_CSS_PATH.read_text(encoding="utf-8")
+
+st.markdown(f"<style>{load_theme_css()}</style>", unsafe_allow_html=True)
+
+@st.cache_resource
+def get_crew_pool() -> queue.Queue:
+    """Idle crews shared across sessions; each keeps its LLM client and agents between launches.
+
+    A crew runs one mission at a time, so concurrent launches each check out
+    their own; at most CREW_WORKERS are ever built.
+    """
+    return queue.Queue()
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    """Runs crews off the script thread so the page keeps polling and can react to Cancel"""
+    return ThreadPoolExecutor(max_workers=CREW_WORKERS, thread_name_prefix="crew")
+
+def run_pooled_crew(pool: queue.Queue, business_requirement: str) -> str:
+    try:
+        crew = pool.get_nowait()
+    except queue.Empty:
+        crew = OpenSourceCrew()
+    try:
+        return crew.run(business_requirement)
+    finally:
+        pool.put(crew)
+
+def show_error(e: Exception):
+    st.error(f"❌ An error occurred during the mission: {e}")
+    st.info("💡 Make sure your API keys are configured in secrets.toml and you have sufficient quota.")
 
 st.markdown('<p class="header">🌌 AI Open Source Researcher</p>', unsafe_allow_html=True)
 st.markdown('<p class="subheader">Describe your vision. Our AI agents will navigate the digital cosmos to find your project\'s perfect match.</p>', unsafe_allow_html=True)
@@ -177,17 +98,38 @@ if research_button:
     if not business_requirement:
         st.warning("📝 Please provide a project blueprint before launching the agents.")
     else:
-        st.markdown("---")
-        
         try:
-            with st.spinner("🌌 Agents are deploying... Navigating the open-source universe..."):
-                crew = OpenSourceCrew(business_requirement)
-                result = crew.run()
+            st.session_state.crew_future = get_executor().submit(run_pooled_crew, get_crew_pool(), business_requirement)
+            st.session_state.crew_started = time.monotonic()
+        except Exception as e:
+            st.markdown("---")
+            show_error(e)
+
+future = st.session_state.get("crew_future")
+if future is not None:
+    st.markdown("---")
+
+    # Clicking Cancel reruns the script, which interrupts the polling loop below
+    if st.button("🛑 Cancel Mission"):
+        # A crew that already started keeps running in the background; its result is discarded
+        future.cancel()
+        st.session_state.crew_future = None
+        st.warning("🛑 Mission cancelled.")
+    else:
+        with st.status("🌌 Agents are deploying... Navigating the open-source universe...") as status:
+            while not future.done():
+                elapsed = int(time.monotonic() - st.session_state.crew_started)
+                status.update(label=f"🌌 Agents are deploying... Navigating the open-source universe... ({elapsed}s)")
+                time.sleep(0.5)
+            status.update(label="🌌 Agents have returned.", state="complete")
+        st.session_state.crew_future = None
+
+        try:
+            result = future.result()
 
             st.balloons()
             st.markdown("### ✅ Mission Complete! Transmission Received:")
             st.markdown(f'<div class="results-box">{result}</div>', unsafe_allow_html=True)
 
         except Exception as e:
-            st.error(f"❌ An error occurred during the mission: {e}")
-            st.info("💡 Make sure your API keys are configured in secrets.toml and you have sufficient quota.")
\ No newline at end of file
+            show_error(e)
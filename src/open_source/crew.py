@@ -1,70 +1,512 @@
 import os
+import re
 import yaml
+import functools
+import hashlib
 import json
-import requests
+import logging
+import random
+import threading
 import time
-from typing import Optional, Dict, Any
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import httpx
+from cachetools import TTLCache
+from typing import Optional, Dict, Any, List, Tuple, NamedTuple
 from crewai import Agent, Task, Crew, Process
 from crewai.tools import tool
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import retry, stop_after_attempt, wait_exponential_jitter, retry_if_exception_type
 from langchain_community.chat_models import ChatLiteLLM
 
 from dotenv import load_dotenv
+
+# Agent progress goes through logging instead of CrewAI's verbose stdout output;
+# enable it with e.g. logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger("open_source.crew")
+
+
+# Load .env once per process, at import. Variables already set in the environment
+# (keys injected by Docker or Cloud Run) take precedence over the file, and the
+# file still supplies every other setting (SERPER_RPS, ENABLE_CORS, ...).
 load_dotenv()
 
-@tool("Github Search")
-def github_search_tool(query: str) -> str:
+# Read once at import (after .env is loaded) instead of on every tool call
+_SERPER_API_KEY = os.getenv("SERPER_API_KEY")
+
+# Config locations, resolved once per process rather than per crew instance
+_DIR = os.path.dirname(os.path.realpath(__file__))
+_AGENTS_YAML = os.path.join(_DIR, 'config/agents.yaml')
+_TASKS_YAML = os.path.join(_DIR, 'config/tasks.yaml')
+
+# orjson decodes Serper responses several times faster; stdlib json is the fallback
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+    def _json_loads(data: bytes) -> Any:
+        return json.loads(data)
+
+# Classifiers for LLM/API errors, compiled once so each check is a single regex scan.
+# Alternatives are ordered by how often they show up, most common first.
+_RETRY_RE = re.compile(r"rate limit|quota|resource_exhausted|overloaded|unavailable|\b503\b", re.IGNORECASE)
+_AUTH_RE = re.compile(r"api key|authentication|permission|forbidden", re.IGNORECASE)
+
+# Prefer the libyaml-backed loader; fall back to the pure-Python one if libyaml is missing
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# Shared HTTP/2 client: repeated Serper calls reuse a warm TLS connection and
+# concurrent ones are multiplexed as streams over it. Retries are handled by tenacity.
+# A TLS connect that takes more than 2s means a dead endpoint, so fail fast and retry.
+# httpx drops idle connections after 5s by default, shorter than an agent's LLM turn
+# between searches; keeping them longer avoids repeating DNS and TLS setup per call
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=120.0)
+_HTTP_TIMEOUT = httpx.Timeout(15.0, connect=2.0)
+_CLIENT = httpx.Client(http2=True, limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT)
+
+# Process-wide cache of formatted search results, keyed on the normalized query and
+# search parameters, so agents repeating a search (or a task being retried) skip both
+# the round-trip and the formatting
+_SERPER_CACHE = TTLCache(maxsize=256, ttl=600)
+_SERPER_CACHE_LOCK = threading.Lock()
+
+# Reordered queries ("self-hosted CRM for Django" vs "django crm self hosted")
+# reuse a cached result when their normalized word sets are identical
+_TERM_RE = re.compile(r"[a-z0-9+#]+")
+_PLURAL_RE = re.compile(r"(?<=\w\w)ies$")
+_STOPWORDS = frozenset({
+    "a", "an", "and", "for", "in", "of", "on", "or", "the", "to", "with",
+    "library", "libraries", "tool", "tools", "project", "projects", "open", "source"
+})
+
+# When Serper stays unreachable after retries, a loosely related cached result
+# is still more useful to the agent than an error
+_FALLBACK_SIMILARITY = 0.3
+
+# Optional on-disk second level: results survive restarts and dev reruns.
+# Without diskcache (or a writable cache dir) only the in-memory cache is used.
+_DISK_CACHE_TTL = 3600
+try:
+    from diskcache import Cache as _DiskCache
+    _SERPER_DISK_CACHE = _DiskCache(
+        os.path.expanduser(os.getenv("SERPER_CACHE_DIR", "~/.cache/open_source_serper")),
+        size_limit=512 << 20
+    )
+except Exception:
+    _SERPER_DISK_CACHE = None
+
+
+def close_pools():
+    """Release the shared HTTP connection pool and the on-disk cache handle at shutdown."""
+    _CLIENT.close()
+    if _SERPER_DISK_CACHE is not None:
+        _SERPER_DISK_CACHE.close()
+
+
+class RateLimitedError(Exception):
+    """An upstream API throttled us; ``retry_after`` is the server's requested delay in seconds."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either as delta-seconds or as an HTTP-date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# Longest server-requested delay we are willing to sleep for before retrying
+_MAX_RETRY_AFTER = 30.0
+# Start small and jitter so concurrent callers do not retry in lockstep
+_FALLBACK_WAIT = wait_exponential_jitter(initial=0.1, max=60)
+
+
+def _wait_retry_after(retry_state) -> float:
+    """tenacity wait: honor the exception's Retry-After (capped, with jitter), else jittered exponential backoff."""
+    retry_after = getattr(retry_state.outcome.exception(), "retry_after", None)
+    if retry_after is None:
+        return _FALLBACK_WAIT(retry_state)
+    delay = min(retry_after, _MAX_RETRY_AFTER)
+    return delay + random.uniform(0, 0.1 * delay)
+
+
+class _AdaptiveRateLimiter:
+    """Token bucket whose refill rate adapts AIMD-style.
+
+    ``acquire`` blocks until a token is available; tokens refill continuously
+    at ``rate`` per second, up to ``burst`` saved for idle periods. Successful
+    calls raise the rate additively up to ``max_rate``; throttled calls
+    (429/503) cut it multiplicatively, down to ``min_rate``.
     """
-    Searches Github for open-source projects based on a query.
-    This tool uses the Serper API to perform a Google search focused on github.com.
+
+    def __init__(self, max_rate: float, burst: Optional[float] = None, increase: float = 0.1,
+                 decrease: float = 0.5, min_rate: float = 0.1):
+        self.max_rate = max_rate
+        self.burst = burst if burst is not None else max(1.0, max_rate)
+        self.increase = increase
+        self.decrease = decrease
+        self.min_rate = min(min_rate, max_rate)
+        self.rate = max_rate
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def on_success(self):
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def on_throttle(self):
+        with self._lock:
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+
+
+# Paces Serper calls across all agents in the process so they
+# self-pace at the allowed rate instead of bursting into 429s and retry storms
+_SERPER_LIMITER = _AdaptiveRateLimiter(max_rate=float(os.getenv("SERPER_RPS", "10")))
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a YAML config once per process; ``mtime`` in the key invalidates it on edit.
+
+    The parsed result is also persisted to a ``<path>.json`` sidecar tagged
+    with a hash of the YAML source, so later processes load JSON instead of
+    re-parsing YAML until the config changes.
     """
-    api_key = os.getenv("SERPER_API_KEY")
-    if not api_key:
-        return "Error: SERPER_API_KEY environment variable not set."
+    with open(path, 'rb') as f:
+        source = f.read()
+    version = hashlib.sha256(source).hexdigest()
+    sidecar_path = f"{path}.json"
+
+    try:
+        if os.path.getmtime(sidecar_path) >= mtime:
+            with open(sidecar_path, 'rb') as f:
+                sidecar = json.load(f)
+            if sidecar.get("version") == version:
+                return sidecar["data"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass  # Missing, stale or corrupt sidecar: fall back to parsing the YAML
+
+    data = yaml.load(source, Loader=_YamlLoader)
+    try:
+        tmp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": version, "data": data}, f)
+        os.replace(tmp_path, sidecar_path)
+    except (OSError, TypeError):
+        pass  # Read-only install or non-JSON values: the in-process cache still applies
+    return data
+
+
+_SERPER_URL = "https://google.serper.dev/search"
+# Built once; callers check _SERPER_API_KEY before anything is sent
+_SERPER_HEADERS = {
+    'X-API-KEY': _SERPER_API_KEY or "",
+    'Content-Type': 'application/json'
+}
+# Transient statuses worth another attempt; only the throttling ones slow the limiter down
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_THROTTLE_STATUSES = frozenset({429, 503})
+# Only the top results are shown to the agents, so don't ask Serper for more
+_RESULT_LIMIT = 6
+_SERPER_NUM = _RESULT_LIMIT
+_STARS_FILTER = "stars:>100"  # Added stars filter for better results
 
-    url = "https://google.serper.dev/search"
-    payload = json.dumps({
-        "q": f"site:github.com {query} stars:>100",  # Added stars filter for better results
-        "num": 8,  # Reduced from 10 for faster response
+
+# Queries that never need a round-trip are answered directly
+_MIN_QUERY_LENGTH = 3
+_URL_RE = re.compile(r"^(?:https?://|www\.)\S*$", re.IGNORECASE)
+# GitHub links are searched by their owner/repo path, which finds the repo's own page
+_GITHUB_URL_RE = re.compile(r"^(?:https?://)?(?:www\.)?github\.com/(\S*?)/?$", re.IGNORECASE)
+# We add our own site:/stars: operators; agents sometimes repeat them in the query
+_OPERATOR_RE = re.compile(r"\b(?:site|stars):\S*", re.IGNORECASE)
+
+
+def _search_text(query: str) -> str:
+    """The part of a query sent to Serper: GitHub links reduced to their path, our operators removed."""
+    query = query.strip()
+    match = _GITHUB_URL_RE.match(query)
+    if match:
+        query = match.group(1)
+    return " ".join(_OPERATOR_RE.sub(" ", query).split())
+
+
+def _direct_answer(query: str) -> Optional[str]:
+    """Answer degenerate queries without searching; None means the query needs Serper."""
+    query = query.strip()
+    if _URL_RE.match(query) and not _GITHUB_URL_RE.match(query):
+        return f"'{query}' is not a GitHub link; search for the project by name or features instead."
+    if len(_search_text(query)) < _MIN_QUERY_LENGTH:
+        return "Query too short: describe the kind of project, features or technologies to search for."
+    return None
+
+
+def _serper_query(query: str) -> Dict[str, Any]:
+    return {
+        "q": f"site:github.com {_search_text(query)} {_STARS_FILTER}",
+        "num": _SERPER_NUM,
         "gl": "us",
         "hl": "en"
-    })
-    headers = {
-        'X-API-KEY': api_key,
-        'Content-Type': 'application/json'
     }
 
+
+# Throttling/5xx responses plus connect/read timeouts and dropped connections
+_SERPER_RETRYABLE = (RateLimitedError, httpx.TransportError)
+
+
+def _decode_response(response: httpx.Response) -> Any:
+    """Report the outcome to the limiter, raise for failed statuses and decode the body."""
+    status = response.status_code
+    if status in _THROTTLE_STATUSES:
+        _SERPER_LIMITER.on_throttle()
+    else:
+        _SERPER_LIMITER.on_success()
+    if status in _RETRY_STATUSES:
+        raise RateLimitedError(
+            f"Serper temporarily unavailable (HTTP {status})",
+            retry_after=_parse_retry_after(response.headers.get("Retry-After"))
+        )
+    response.raise_for_status()
     try:
-        response = requests.post(url, headers=headers, data=payload, timeout=15)  # Reduced timeout
-        response.raise_for_status()
-        results = response.json()
-        
-        if 'organic' in results and results['organic']:
-            formatted_results = []
-            for idx, item in enumerate(results['organic'][:6], 1):  # Limit to top 6 results
-                title = item.get('title', 'N/A')
-                link = item.get('link', '#')
-                snippet = item.get('snippet', 'No description available.')
-                
-                formatted_results.append(
-                    f"{idx}. **{title}**\n   URL: {link}\n   Description: {snippet}\n"
-                )
-            
-            return "\n".join(formatted_results) if formatted_results else "No relevant GitHub projects found."
-        else:
-            return f"No GitHub projects found for query: {query}."
-            
+        return _json_loads(response.content)
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses it
+        raise ValueError(f"Serper returned malformed JSON (HTTP {status}): {e}") from e
+
+
+@retry(
+    retry=retry_if_exception_type(_SERPER_RETRYABLE),
+    stop=stop_after_attempt(3),
+    wait=_wait_retry_after,
+    reraise=True
+)
+def _serper_post(payload: Any) -> Any:
+    """POST a single query or a batch of queries to Serper and return the decoded JSON.
+
+    Serper answers a JSON array of queries with an array of results in the same order.
+    429 and transient 5xx responses are retried, after the delay the server asks for if any,
+    as are timeouts and dropped connections.
+    """
+    _SERPER_LIMITER.acquire()
+    return _decode_response(
+        _CLIENT.post(_SERPER_URL, headers=_SERPER_HEADERS, content=_json_dumps(payload))
+    )
+
+
+class _Hit(NamedTuple):
+    """One organic search result, reduced to the fields the agents use."""
+    title: str
+    link: str
+    snippet: str
+
+
+def _parse_hits(results: Dict[str, Any]) -> Tuple[_Hit, ...]:
+    return tuple(
+        _Hit(item.get('title', 'N/A'), item.get('link', '#'), item.get('snippet', 'No description available.'))
+        for item in (results.get('organic') or ())[:_RESULT_LIMIT]
+    )
+
+
+def _format_results(query: str, results: Dict[str, Any]) -> str:
+    hits = _parse_hits(results)
+    if not hits:
+        return f"No GitHub projects found for query: {query}."
+    return "\n".join(
+        f"{idx}. **{hit.title}**\n"
+        f"   URL: {hit.link}\n"
+        f"   Description: {hit.snippet}\n"
+        for idx, hit in enumerate(hits, 1)
+    )
+
+
+def _cache_key(query: str) -> Tuple[str, int, str]:
+    # Collapse case, whitespace and repeated operators so trivially different phrasings share an entry
+    return _search_text(query.lower()), _SERPER_NUM, _STARS_FILTER
+
+
+def _cache_get(query: str) -> Optional[str]:
+    key = _cache_key(query)
+    with _SERPER_CACHE_LOCK:
+        result = _SERPER_CACHE.get(key)
+    if result is None and _SERPER_DISK_CACHE is not None:
+        result = _SERPER_DISK_CACHE.get(key)
+        if result is not None:
+            with _SERPER_CACHE_LOCK:
+                _SERPER_CACHE[key] = result
+    if result is None:
+        result = _similar_cached(query, threshold=1.0)
+    return result
+
+
+def _query_terms(query: str) -> frozenset:
+    """Normalized content words of a query: lowercased, stopwords dropped, "-ies" plurals singularized."""
+    return frozenset(
+        _PLURAL_RE.sub("y", word)
+        for word in _TERM_RE.findall(query.lower()) if word not in _STOPWORDS
+    )
+
+
+def _similar_cached(query: str, threshold: float) -> Optional[str]:
+    """Return the in-memory result whose query is most similar (Jaccard on terms) at or above ``threshold``.
+
+    A threshold of 1.0 only matches queries with the same terms, which are safe to
+    serve as-is; anything looser must be labelled as a related result by the caller.
+    """
+    # Cached keys hold _search_text() output, so normalize the query the same way
+    terms = _query_terms(_search_text(query))
+    if not terms:
+        return None
+    with _SERPER_CACHE_LOCK:
+        entries = list(_SERPER_CACHE.items())
+
+    best, best_score = None, threshold
+    for (cached_query, num, stars), result in entries:
+        if num != _SERPER_NUM or stars != _STARS_FILTER:
+            continue
+        other = _query_terms(cached_query)
+        score = len(terms & other) / len(terms | other) if other else 0.0
+        if score >= best_score:
+            best, best_score = result, score
+    return best
+
+
+def _cache_put(query: str, result: str):
+    key = _cache_key(query)
+    with _SERPER_CACHE_LOCK:
+        _SERPER_CACHE[key] = result
+    if _SERPER_DISK_CACHE is not None:
+        _SERPER_DISK_CACHE.set(key, result, expire=_DISK_CACHE_TTL)
+
+
+def _search_error(query: str, error: BaseException) -> str:
+    """Result text for a failed search: the closest cached result if any, else the error."""
+    fallback = _similar_cached(query, threshold=_FALLBACK_SIMILARITY)
+    if fallback is not None:
+        return f"Search unavailable right now; showing cached results for a similar query:\n{fallback}"
+    return f"Search error: {str(error)[:100]}..."
+
+
+def _search_github(query: str) -> str:
+    """Run one Serper search for ``query`` and return the formatted results."""
+    if not _SERPER_API_KEY:
+        return "Error: SERPER_API_KEY environment variable not set."
+
+    cached = _direct_answer(query) or _cache_get(query)
+    if cached is not None:
+        return cached
+
+    try:
+        result = _format_results(query, _serper_post(_serper_query(query)))
     except Exception as e:
-        return f"Search error: {str(e)[:100]}..."
+        return _search_error(query, e)
+
+    _cache_put(query, result)
+    return result
+
+
+def _search_github_batch(queries: List[str]) -> List[str]:
+    """Search several queries with a single Serper request for the uncached ones."""
+    if not _SERPER_API_KEY:
+        return ["Error: SERPER_API_KEY environment variable not set."] * len(queries)
+
+    found = {query: _direct_answer(query) or _cache_get(query) for query in queries}
+    misses = [query for query, result in found.items() if result is None]
+    if misses:
+        try:
+            batch = _serper_post([_serper_query(query) for query in misses])
+            if not isinstance(batch, list) or len(batch) != len(misses):
+                raise ValueError("unexpected batch response from Serper")
+            for query, results in zip(misses, batch):
+                found[query] = _format_results(query, results)
+                _cache_put(query, found[query])
+        except Exception as e:
+            for query in misses:
+                found[query] = _search_error(query, e)
+    return [found[query] for query in queries]
+
+
+@tool("Github Search")
+def github_search_tool(query: str) -> str:
+    """
+    Searches Github for open-source projects based on a query.
+    This tool uses the Serper API to perform a Google search focused on github.com.
+    """
+    return _search_github(query)
+
+
+@tool("Github Multi-Search")
+def github_multi_search_tool(queries: List[str]) -> str:
+    """
+    Searches Github for open-source projects for several queries at once.
+    Prefer this over repeated Github Search calls when you already know the
+    queries you want to run; all of them are sent in a single request.
+    """
+    queries = list(dict.fromkeys(query for query in queries if query and query.strip()))
+    if not queries:
+        return "Error: no search queries provided."
+
+    results = _search_github_batch(queries)
+    return "\n".join(
+        f"### Results for: {query}\n{result}" for query, result in zip(queries, results)
+    )
+
+
+def _log_step(step: Any):
+    """Crew step callback: one DEBUG record per agent step."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Agent step: %s", type(step).__name__)
+
+
+def _log_task(output: Any):
+    """Crew task callback: one INFO record per completed task."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Task completed by %s", getattr(output, "agent", "unknown agent"))
 
 
 class OpenSourceCrew:
-    def __init__(self, business_requirement: str, gemini_api_key: Optional[str] = None):
+    def __init__(self, business_requirement: Optional[str] = None, gemini_api_key: Optional[str] = None):
         self.business_requirement = business_requirement
         self.gemini_api_key = gemini_api_key
         self.llm = self._create_llm()
         self._setup_environment()
         self._load_configs()
+        self._crew: Optional[Crew] = None
+        # kickoff() mutates the crew's tasks, so callers sharing an instance take turns
+        self._run_lock = threading.Lock()
 
     def _setup_environment(self):
         if self.gemini_api_key:
@@ -75,13 +517,8 @@ class OpenSourceCrew:
 
     def _load_configs(self):
         try:
-            dir_path = os.path.dirname(os.path.realpath(__file__))
-            agents_config_path = os.path.join(dir_path, 'config/agents.yaml')
-            tasks_config_path = os.path.join(dir_path, 'config/tasks.yaml')
-            with open(agents_config_path, 'r', encoding='utf-8') as f:
-                self.agents_config = yaml.safe_load(f)
-            with open(tasks_config_path, 'r', encoding='utf-8') as f:
-                self.tasks_config = yaml.safe_load(f)
+            self.agents_config = _load_yaml(_AGENTS_YAML, os.path.getmtime(_AGENTS_YAML))
+            self.tasks_config = _load_yaml(_TASKS_YAML, os.path.getmtime(_TASKS_YAML))
                 
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Configuration file not found: {e}")
@@ -98,98 +535,127 @@ class OpenSourceCrew:
         except Exception as e:
             raise ValueError(f"Failed to initialize Gemini AI: {str(e)}")
 
-    def _execute_crew(self, crew: Crew) -> str:
-        """Execute the crew with timeout protection."""
+    @retry(
+        retry=retry_if_exception_type(RateLimitedError),
+        stop=stop_after_attempt(5),
+        wait=_wait_retry_after,
+        reraise=True
+    )
+    def _execute_crew(self, crew: Crew, inputs: Dict[str, Any]) -> str:
+        """Execute the crew with timeout protection, retrying rate-limited runs with backoff."""
         try:
-            result = crew.kickoff()
+            result = crew.kickoff(inputs=inputs)
             return str(result)
         except Exception as e:
-            error_msg = str(e).lower()
-            if any(keyword in error_msg for keyword in ['overloaded', 'unavailable', '503', 'rate limit', 'quota', 'resource_exhausted']):
-                raise e
-            elif any(keyword in error_msg for keyword in ['api key', 'authentication', 'permission', 'forbidden']):
+            error_msg = str(e)
+            if _RETRY_RE.search(error_msg):
+                # Carry the provider's Retry-After (if the client exposed the response) to retry logic
+                response = getattr(e, "response", None)
+                headers = getattr(response, "headers", None) or {}
+                raise RateLimitedError(
+                    error_msg, retry_after=_parse_retry_after(headers.get("Retry-After"))
+                ) from e
+            elif _AUTH_RE.search(error_msg):
                 raise ValueError(f"Authentication error: Please check your Gemini API key.")
             else:
                 raise e
 
-    def run(self) -> str:
-        """Sets up and runs the crew with optimized configuration."""
-        try:
-            agents_cfg = self.agents_config
-            tasks_cfg = self.tasks_config
-            llm = self._create_llm()
-
-            # Create streamlined agents
-            requirement_analyst = Agent(
-                role=agents_cfg['requirement_analyst']['role'],
-                goal=agents_cfg['requirement_analyst']['goal'],
-                backstory=agents_cfg['requirement_analyst']['backstory'],
-                llm=llm,
-                verbose=False,  # Reduced verbosity for speed
-                max_execution_time=30  # 30 second timeout
-            )
-            
-            open_source_researcher = Agent(
-                role=agents_cfg['open_source_researcher']['role'],
-                goal=agents_cfg['open_source_researcher']['goal'],
-                backstory=agents_cfg['open_source_researcher']['backstory'],
-                tools=[github_search_tool],
-                llm=llm,
-                verbose=False,
-                max_execution_time=45  # 45 second timeout
-            )
-            
-            project_evaluator = Agent(
-                role=agents_cfg['project_evaluator']['role'],
-                goal=agents_cfg['project_evaluator']['goal'],
-                backstory=agents_cfg['project_evaluator']['backstory'],
-                llm=llm,
-                verbose=False,
-                max_execution_time=30  # 30 second timeout
-            )
-            
-            # Create optimized tasks
-            analyze_task = Task(
-                description=tasks_cfg['analyze_requirements']['description'].format(
-                    business_requirement=self.business_requirement
-                ),
-                expected_output=tasks_cfg['analyze_requirements']['expected_output'],
-                agent=requirement_analyst
-            )
+    def _build_crew(self) -> Crew:
+        """Builds the agents, tasks and crew once per instance.
 
-            research_task = Task(
-                description=tasks_cfg['research_projects']['description'],
-                expected_output=tasks_cfg['research_projects']['expected_output'],
-                agent=open_source_researcher,
-                context=[analyze_task]
-            )
-            
-            evaluate_task = Task(
-                description=tasks_cfg['evaluate_projects']['description'],
-                expected_output=tasks_cfg['evaluate_projects']['expected_output'],
-                agent=project_evaluator,
-                context=[analyze_task, research_task]
-            )
+        Task descriptions keep their ``{business_requirement}`` placeholder;
+        CrewAI interpolates the per-run value at kickoff.
+        """
+        agents_cfg = self.agents_config
+        tasks_cfg = self.tasks_config
+        llm = self.llm
 
-            # Optimized crew configuration
-            crew = Crew(
-                agents=[requirement_analyst, open_source_researcher, project_evaluator],
-                tasks=[analyze_task, research_task, evaluate_task],
-                process=Process.sequential,
-                verbose=False,  # Reduced verbosity
-                memory=False,
-                max_rpm=30,  # Increased from 5 to 30
-                max_execution_time=120  # 2 minute total timeout
-            )
+        # Create streamlined agents
+        requirement_analyst = Agent(
+            role=agents_cfg['requirement_analyst']['role'],
+            goal=agents_cfg['requirement_analyst']['goal'],
+            backstory=agents_cfg['requirement_analyst']['backstory'],
+            llm=llm,
+            verbose=False,  # Reduced verbosity for speed
+            max_execution_time=30  # 30 second timeout
+        )
+        
+        open_source_researcher = Agent(
+            role=agents_cfg['open_source_researcher']['role'],
+            goal=agents_cfg['open_source_researcher']['goal'],
+            backstory=agents_cfg['open_source_researcher']['backstory'],
+            tools=[github_search_tool, github_multi_search_tool],
+            llm=llm,
+            verbose=False,
+            max_execution_time=45  # 45 second timeout
+        )
+        
+        project_evaluator = Agent(
+            role=agents_cfg['project_evaluator']['role'],
+            goal=agents_cfg['project_evaluator']['goal'],
+            backstory=agents_cfg['project_evaluator']['backstory'],
+            llm=llm,
+            verbose=False,
+            max_execution_time=30  # 30 second timeout
+        )
+        
+        # Create optimized tasks
+        analyze_task = Task(
+            description=tasks_cfg['analyze_requirements']['description'],
+            expected_output=tasks_cfg['analyze_requirements']['expected_output'],
+            agent=requirement_analyst
+        )
+
+        research_task = Task(
+            description=tasks_cfg['research_projects']['description'],
+            expected_output=tasks_cfg['research_projects']['expected_output'],
+            agent=open_source_researcher,
+            context=[analyze_task]
+        )
+        
+        evaluate_task = Task(
+            description=tasks_cfg['evaluate_projects']['description'],
+            expected_output=tasks_cfg['evaluate_projects']['expected_output'],
+            agent=project_evaluator,
+            context=[analyze_task, research_task]
+        )
 
-            result = self._execute_crew(crew)
-            return result
+        # Optimized crew configuration
+        return Crew(
+            agents=[requirement_analyst, open_source_researcher, project_evaluator],
+            tasks=[analyze_task, research_task, evaluate_task],
+            process=Process.sequential,
+            verbose=False,  # Progress is reported through the logging callbacks
+            step_callback=_log_step,
+            task_callback=_log_task,
+            memory=False,
+            max_rpm=30,  # Increased from 5 to 30
+            max_execution_time=120  # 2 minute total timeout
+        )
+
+    def run(self, business_requirement: Optional[str] = None) -> str:
+        """Runs the crew with optimized configuration.
+
+        A requirement passed here takes precedence over the one given at
+        construction, so a single instance can be reused across requests.
+        The crew is built on the first run and reused afterwards.
+        """
+        business_requirement = business_requirement or self.business_requirement
+        if not business_requirement:
+            raise ValueError("Business requirement is required.")
+
+        try:
+            with self._run_lock:
+                if self._crew is None:
+                    self._crew = self._build_crew()
+                return self._execute_crew(self._crew, {"business_requirement": business_requirement})
 
         except ValueError as e:
             raise e
         except Exception as e:
             error_msg = str(e)
-            if any(keyword in error_msg.lower() for keyword in ['overloaded', 'unavailable', '503', 'rate limit', 'quota']):
+            # _execute_crew already classified rate-limit errors; only rescan anything else
+            if isinstance(e, RateLimitedError) or _RETRY_RE.search(error_msg):
                 return f"⚠️ Service temporarily unavailable. Please try again shortly.\n\nDetails: {error_msg}"
             else:
                 return f"❌ Execution error: {error_msg}"
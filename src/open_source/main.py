@@ -1,10 +1,25 @@
-from src.open_source.crew import OpenSourceCrew
+import os
+import sys
+import functools
+
+# Hosts with an outdated system sqlite3 (too old for chromadb) can opt into
+# the bundled pysqlite3 build; it has to be swapped in before crewai is imported
+if os.getenv("USE_PYSQLITE3"):
+    from importlib import import_module
+    sys.modules["sqlite3"] = import_module("pysqlite3")
+
+from .crew import OpenSourceCrew
+
+@functools.lru_cache(maxsize=1)
+def build_crew() -> OpenSourceCrew:
+    """Build the crew once per process; the LLM client, configs and agents are reused across runs."""
+    return OpenSourceCrew()
+
+def run(business_requirement: str) -> str:
+    return build_crew().run(business_requirement)
 
 def main():
-    business_requirement = input("Please provide your business requirement: ")
-    crew = OpenSourceCrew(business_requirement)
-    result = crew.run()
-    print(result)
+    print(run(input("Please provide your business requirement: ")))
 
 if __name__ == "__main__":
     main()
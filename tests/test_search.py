@@ -0,0 +1,88 @@
+import pytest
+
+pytest.importorskip("crewai")
+
+from src.open_source import crew
+
+
+def _organic(count):
+    return {"organic": [
+        {"title": f"Project {i}", "link": f"https://github.com/acme/project-{i}", "snippet": f"Snippet {i}"}
+        for i in range(1, count + 1)
+    ]}
+
+
+@pytest.fixture
+def serper(monkeypatch):
+    """Stub Serper: records every payload and answers with canned organic results."""
+    calls = []
+
+    def fake_post(payload):
+        calls.append(payload)
+        if isinstance(payload, list):
+            return [_organic(2) for _ in payload]
+        return _organic(10)
+
+    monkeypatch.setattr(crew, "_serper_post", fake_post)
+    monkeypatch.setattr(crew, "_SERPER_API_KEY", "test-key")
+    monkeypatch.setattr(crew, "_SERPER_DISK_CACHE", None)
+    crew._SERPER_CACHE.clear()
+    yield calls
+    crew._SERPER_CACHE.clear()
+
+
+def test_format_results_caps_hits_and_fills_defaults():
+    text = crew._format_results("crm", {"organic": [{"title": "CRM"}] + _organic(9)["organic"]})
+
+    assert text.startswith("1. **CRM**\n   URL: #\n   Description: No description available.\n")
+    assert f"{crew._RESULT_LIMIT}. **Project {crew._RESULT_LIMIT - 1}**" in text
+    assert f"**Project {crew._RESULT_LIMIT}**" not in text
+
+
+def test_format_results_without_hits():
+    assert crew._format_results("crm", {}) == "No GitHub projects found for query: crm."
+
+
+def test_search_github_formats_and_caches(serper):
+    first = crew._search_github("self-hosted CRM for Django")
+
+    assert "1. **Project 1**" in first
+    assert serper[0]["q"] == f"site:github.com self-hosted CRM for Django {crew._STARS_FILTER}"
+    assert serper[0]["num"] == crew._RESULT_LIMIT
+
+    # Same terms in another order, or with our own operators repeated, is a cache hit
+    assert crew._search_github("django crm self hosted") == first
+    assert crew._search_github("site:github.com django crm self hosted stars:>500") == first
+    assert len(serper) == 1
+
+
+def test_search_github_answers_degenerate_queries_directly(serper):
+    assert crew._search_github("ab").startswith("Query too short")
+    assert crew._search_github("https://gitlab.com/acme/crm").startswith("'https://gitlab.com/acme/crm' is not a GitHub link")
+    assert serper == []
+
+
+def test_search_github_batch_sends_one_request_for_misses(serper):
+    crew._search_github("python web framework")
+
+    results = crew._search_github_batch(["python web framework", "rust http server", "go http server"])
+
+    assert len(serper) == 2
+    assert [payload["q"] for payload in serper[1]] == [
+        f"site:github.com rust http server {crew._STARS_FILTER}",
+        f"site:github.com go http server {crew._STARS_FILTER}",
+    ]
+    assert "Project 10" not in results[0] and all("1. **Project 1**" in result for result in results)
+
+
+def test_search_error_falls_back_to_similar_cached_result(serper, monkeypatch):
+    cached = crew._search_github("django crm")
+
+    def failing_post(payload):
+        raise crew.RateLimitedError("Serper temporarily unavailable (HTTP 503)")
+
+    monkeypatch.setattr(crew, "_serper_post", failing_post)
+
+    assert crew._search_github("django crm docker").endswith(cached)
+    assert crew._search_github("site:github.com django crm docker").endswith(cached)
+    assert crew._search_github("rust embedded hal").startswith("Search error: Serper temporarily unavailable")